@@ -8,8 +8,8 @@ from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
 from .contracts import error_with_diagnostics
-from .models import Experiment, FeedingEvent, Plant, TrayPlant
-from .tray_placement import build_location
+from .models import Experiment, FeedingEvent, Plant
+from .tray_placement import TrayPlacementInfo, experiment_placement_infos, location_payload
 
 FEEDING_QUEUE_WINDOW_DAYS = 7
 _MIN_DATETIME = datetime.min.replace(tzinfo=dt_timezone.utc)
@@ -29,12 +29,12 @@ def _last_fed_map(experiment: Experiment) -> dict[str, datetime]:
     events = (
         FeedingEvent.objects.filter(experiment=experiment)
         .order_by("plant_id", "-occurred_at")
-        .only("plant", "occurred_at")
+        .values_list("plant_id", "occurred_at")
     )
-    for event in events:
-        plant_key = str(event.plant.id)
+    for plant_id, occurred_at in events:
+        plant_key = str(plant_id)
         if plant_key not in last_fed_by_plant:
-            last_fed_by_plant[plant_key] = event.occurred_at
+            last_fed_by_plant[plant_key] = occurred_at
     return last_fed_by_plant
 
 
@@ -51,11 +51,11 @@ def _queue_payload_item(
     plant: Plant,
     last_fed_at: datetime | None,
     *,
-    tray_placement: TrayPlant | None,
+    placement: TrayPlacementInfo | None,
     blocked_reason: str | None,
 ) -> dict[str, object]:
     assigned_recipe = plant.assigned_recipe
-    location = build_location(tray_placement)
+    location = location_payload(placement)
     return {
         "uuid": str(plant.id),
         "plant_id": plant.plant_id,
@@ -92,19 +92,13 @@ def experiment_feeding_queue(request, experiment_id: UUID):
         .order_by("id")
     )
     last_fed_by_plant = _last_fed_map(experiment)
-    tray_placements = {
-        str(item.plant.id): item
-        for item in TrayPlant.objects.filter(tray__experiment=experiment).select_related(
-            "tray__slot__tent"
-        )
-    }
+    placements = experiment_placement_infos(experiment.id)
 
     def plant_last_fed(plant: Plant) -> datetime | None:
         return last_fed_by_plant.get(str(plant.id))
 
     def plant_blocked_reason(plant: Plant) -> str | None:
-        tray_placement = tray_placements.get(str(plant.id))
-        if tray_placement is None:
+        if str(plant.id) not in placements:
             return "Unplaced"
         if plant.assigned_recipe is None:
             return "Needs plant recipe"
@@ -140,7 +134,7 @@ def experiment_feeding_queue(request, experiment_id: UUID):
                     _queue_payload_item(
                         plant,
                         plant_last_fed(plant),
-                        tray_placement=tray_placements.get(str(plant.id)),
+                        placement=placements.get(str(plant.id)),
                         blocked_reason=plant_blocked_reason(plant),
                     )
                     for plant in ordered_plants[:50]
@@ -7,11 +7,7 @@ from rest_framework.response import Response
 
 from .baseline import BASELINE_WEEK_NUMBER
 from .models import Experiment, Plant, PlantWeeklyMetric
-from .tray_placement import (
-    build_location,
-    experiment_tray_current_counts,
-    experiment_tray_placements,
-)
+from .tray_placement import experiment_placement_infos, location_payload
 
 
 
@@ -42,8 +38,7 @@ def experiment_overview_plants(request, experiment_id: UUID):
         .select_related("species", "assigned_recipe")
         .order_by("plant_id", "created_at")
     )
-    tray_placements = experiment_tray_placements(experiment.id)
-    tray_current_counts = experiment_tray_current_counts(experiment.id)
+    placements = experiment_placement_infos(experiment.id)
     baseline_plant_ids = {
         str(item)
         for item in PlantWeeklyMetric.objects.filter(
@@ -62,11 +57,8 @@ def experiment_overview_plants(request, experiment_id: UUID):
     needs_assignment_count = 0
 
     for plant in plants:
-        tray_placement = tray_placements.get(str(plant.id))
-        location = build_location(
-            tray_placement,
-            tray_current_count=tray_current_counts.get(str(tray_placement.tray.id)) if tray_placement else None,
-        )
+        placement = placements.get(str(plant.id))
+        location = location_payload(placement)
         assigned_recipe = plant.assigned_recipe
         has_baseline = str(plant.id) in baseline_plant_ids
         is_active = plant.status == Plant.Status.ACTIVE
@@ -76,11 +68,11 @@ def experiment_overview_plants(request, experiment_id: UUID):
                 needs_baseline_count += 1
             if not plant.grade:
                 needs_grade_count += 1
-            if tray_placement is None:
+            if placement is None:
                 needs_placement_count += 1
             if assigned_recipe is None:
                 needs_plant_recipe_count += 1
-            if tray_placement is None or assigned_recipe is None:
+            if placement is None or assigned_recipe is None:
                 needs_assignment_count += 1
         else:
             removed_count += 1
@@ -6,12 +6,23 @@ from dataclasses import dataclass, field
 from uuid import UUID
 
 from django.db import transaction
+from django.db.models import Prefetch
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
 from .baseline import BASELINE_WEEK_NUMBER
 from .contracts import error_with_diagnostics, list_envelope
-from .models import Experiment, Plant, PlantWeeklyMetric, Recipe, Slot, Tent, Tray, TrayPlant
+from .models import (
+    Experiment,
+    Plant,
+    PlantWeeklyMetric,
+    Recipe,
+    Slot,
+    Species,
+    Tent,
+    Tray,
+    TrayPlant,
+)
 from .tent_restrictions import tent_allows_species
 from .tray_placement import build_location, experiment_tray_placements
 
@@ -108,7 +119,7 @@ def experiment_placement_summary(request, experiment_id: UUID):
 
     tents = list(
         Tent.objects.filter(experiment=experiment)
-        .prefetch_related("allowed_species")
+        .prefetch_related(Prefetch("allowed_species", queryset=Species.objects.order_by("name")))
         .order_by("name", "id")
     )
     slots = list(
@@ -129,7 +140,7 @@ def experiment_placement_summary(request, experiment_id: UUID):
         "order_index",
         "id",
     ):
-        tray_items_by_tray_id.setdefault(str(item.tray.id), []).append(item)
+        tray_items_by_tray_id.setdefault(str(item.tray_id), []).append(item)
 
     placement_map = experiment_tray_placements(experiment.id)
     placed_plant_ids = set(placement_map.keys())
@@ -158,7 +169,7 @@ def experiment_placement_summary(request, experiment_id: UUID):
                         "name": species.name,
                         "category": species.category,
                     }
-                    for species in tent.allowed_species.all().order_by("name")
+                    for species in tent.allowed_species.all()
                 ],
                 "slots": [
                     {
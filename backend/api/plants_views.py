@@ -288,6 +288,7 @@ def experiment_plants_bulk_import(request, experiment_id: UUID):
     rows = _load_csv_rows(request)
     allocator = ExperimentPlantIdAllocator(experiment)
     created: list[Plant] = []
+    species_by_name: dict[str, Species] = {}
 
     with transaction.atomic():
         for row_index, row in enumerate(rows, start=2):
@@ -313,11 +314,15 @@ def experiment_plants_bulk_import(request, experiment_id: UUID):
                     f"Row {row_index}: plant_id cannot be provided when quantity is greater than 1."
                 )
 
-            species = _resolve_species(
-                species_id=None,
-                species_name=species_name,
-                category=category,
-            )
+            species_key = species_name.lower()
+            species = species_by_name.get(species_key)
+            if species is None or (category and not species.category):
+                species = _resolve_species(
+                    species_id=None,
+                    species_name=species_name,
+                    category=category,
+                )
+                species_by_name[species_key] = species
             for item_index in range(quantity):
                 plant_id = requested_plant_id if item_index == 0 else ""
                 try:
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from .baseline import BASELINE_WEEK_NUMBER
 from .models import Experiment, Plant, PlantWeeklyMetric, Recipe, Slot, Tent
 from .schedules import plan_for_experiment
-from .tent_restrictions import tent_allows_species
+from .tent_restrictions import experiment_allowed_species_ids
 from .tray_placement import experiment_tray_placements
 
 
@@ -77,6 +77,7 @@ def compute_readiness_counts(experiment: Experiment) -> ReadinessCounts:
     needs_plant_recipe = 0
     needs_tent_restriction = 0
     tray_placements = experiment_tray_placements(experiment.id)
+    allowed_species_ids_by_tent = experiment_allowed_species_ids(experiment.id) if tray_placements else {}
 
     for plant in active_plants:
         if str(plant.id) not in baseline_plant_ids or not plant.grade:
@@ -85,10 +86,10 @@ def compute_readiness_counts(experiment: Experiment) -> ReadinessCounts:
         tray_placement = tray_placements.get(str(plant.id))
         if tray_placement is None:
             needs_placement += 1
-        elif tray_placement.tray.slot and tray_placement.tray.slot.tent and not tent_allows_species(
-            tray_placement.tray.slot.tent, plant.species.id
-        ):
-            needs_tent_restriction += 1
+        elif tray_placement.tray.slot:
+            allowed_species_ids = allowed_species_ids_by_tent.get(tray_placement.tray.slot.tent_id)
+            if allowed_species_ids is not None and plant.species_id not in allowed_species_ids:
+                needs_tent_restriction += 1
         if plant.assigned_recipe is None:
             needs_plant_recipe += 1
         if tray_placement is None or plant.assigned_recipe is None:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from uuid import UUID
+
 from .models import Plant, Tent
 
 
@@ -9,6 +11,15 @@ def tent_allows_species(tent: Tent, species_id) -> bool:
     return tent.allowed_species.filter(id=species_id).exists()
 
 
+def experiment_allowed_species_ids(experiment_id) -> dict[UUID, set[UUID]]:
+    allowed_ids_by_tent: dict[UUID, set[UUID]] = {}
+    for tent_id, species_id in Tent.allowed_species.through.objects.filter(
+        tent__experiment_id=experiment_id
+    ).values_list("tent_id", "species_id"):
+        allowed_ids_by_tent.setdefault(tent_id, set()).add(species_id)
+    return allowed_ids_by_tent
+
+
 def first_disallowed_plant(tent: Tent, plants) -> Plant | None:
     if not tent.allowed_species.exists():
         return None
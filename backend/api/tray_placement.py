@@ -7,7 +7,7 @@ from django.db.models import Count
 from .models import Plant, TrayPlant
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrayPlacementInfo:
     tray_id: str
     tray_name: str
@@ -24,15 +24,35 @@ class TrayPlacementInfo:
     tent_name: str | None
 
 
+# Columns behind every TrayPlacementInfo. experiment_placement_infos() reads them with .values()
+# and experiment_tray_placements() loads only these with .only(), so a column added here reaches
+# both paths.
+PLACEMENT_VALUES = (
+    "tray_id",
+    "tray__name",
+    "tray__capacity",
+    "tray__slot_id",
+    "tray__slot__code",
+    "tray__slot__label",
+    "tray__slot__shelf_index",
+    "tray__slot__slot_index",
+    "tray__slot__tent_id",
+    "tray__slot__tent__code",
+    "tray__slot__tent__name",
+)
+
+
 def plant_tray_placement(plant: Plant) -> TrayPlant | None:
     return TrayPlant.objects.filter(plant=plant).select_related("tray__slot__tent").first()
 
 
 def experiment_tray_placements(experiment_id) -> dict[str, TrayPlant]:
-    placements = TrayPlant.objects.filter(tray__experiment_id=experiment_id).select_related(
-        "tray__slot__tent", "plant"
+    placements = (
+        TrayPlant.objects.filter(tray__experiment_id=experiment_id)
+        .select_related("tray__slot__tent")
+        .only("plant_id", *PLACEMENT_VALUES)
     )
-    return {str(item.plant.id): item for item in placements}
+    return {str(item.plant_id): item for item in placements}
 
 
 def experiment_tray_current_counts(experiment_id) -> dict[str, int]:
@@ -44,6 +64,32 @@ def experiment_tray_current_counts(experiment_id) -> dict[str, int]:
     return {str(item["tray_id"]): int(item["total"]) for item in counts}
 
 
+def experiment_placement_infos(experiment_id) -> dict[str, TrayPlacementInfo]:
+    tray_current_counts = experiment_tray_current_counts(experiment_id)
+    rows = TrayPlant.objects.filter(tray__experiment_id=experiment_id).values("plant_id", *PLACEMENT_VALUES)
+    infos: dict[str, TrayPlacementInfo] = {}
+    for row in rows:
+        tray_id = str(row["tray_id"])
+        slot_id = row["tray__slot_id"]
+        tent_id = row["tray__slot__tent_id"]
+        infos[str(row["plant_id"])] = TrayPlacementInfo(
+            tray_id=tray_id,
+            tray_name=row["tray__name"],
+            tray_code=row["tray__name"],
+            tray_capacity=row["tray__capacity"],
+            tray_current_count=tray_current_counts.get(tray_id, 0),
+            slot_id=str(slot_id) if slot_id else None,
+            slot_code=row["tray__slot__code"],
+            slot_label=row["tray__slot__label"],
+            shelf_index=row["tray__slot__shelf_index"],
+            slot_index=row["tray__slot__slot_index"],
+            tent_id=str(tent_id) if tent_id else None,
+            tent_code=row["tray__slot__tent__code"],
+            tent_name=row["tray__slot__tent__name"],
+        )
+    return infos
+
+
 def placement_info(
     tray_placement: TrayPlant | None,
     *,
@@ -77,7 +123,10 @@ def build_location(
     *,
     tray_current_count: int | None = None,
 ) -> dict:
-    placement = placement_info(tray_placement, tray_current_count=tray_current_count)
+    return location_payload(placement_info(tray_placement, tray_current_count=tray_current_count))
+
+
+def location_payload(placement: TrayPlacementInfo | None) -> dict:
     if not placement:
         return {
             "status": "unplaced",
@@ -5,3 +5,11 @@ NODE_ENV = "development"
 ENABLE_DEV_AUTH_BYPASS = True
 CF_ACCESS_CONFIGURED = False
 DEV_AUTH_BYPASS_ENABLED = True
+
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# Uploaded photos only need to round-trip through the API; keep them in memory.
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
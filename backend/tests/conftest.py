@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from uuid import UUID
+
 import pytest
+from django.conf import settings
 from django.utils import timezone
 from rest_framework.test import APIClient
 
 from api.baseline import BASELINE_WEEK_NUMBER
 from api.models import (
+    AppUser,
     Experiment,
     Plant,
     PlantWeeklyMetric,
@@ -14,6 +18,7 @@ from api.models import (
     Species,
     Tent,
     Tray,
+    TrayPlant,
 )
 
 
@@ -22,6 +27,17 @@ def api_client() -> APIClient:
     return APIClient()
 
 
+@pytest.fixture
+def app_user() -> AppUser:
+    # The dev-bypass middleware creates this user on the first request of a test; creating it
+    # up front keeps that insert out of django_assert_num_queries pins.
+    return AppUser.objects.create(
+        email=settings.DEV_EMAIL or settings.ADMIN_EMAIL,
+        role=AppUser.Role.ADMIN,
+        status=AppUser.Status.ACTIVE,
+    )
+
+
 @pytest.fixture
 def species() -> Species:
     return Species.objects.create(name="Nepenthes ventricosa", category="nepenthes")
@@ -37,15 +53,32 @@ def experiment() -> Experiment:
     return Experiment.objects.create(name="Contract Experiment")
 
 
+@pytest.fixture
+def make_experiment():
+    def _make_experiment(name: str, *, with_default_tent: bool = True) -> Experiment:
+        if with_default_tent:
+            return Experiment.objects.create(name=name)
+        # bulk_create skips post_save, so the default TN1 tent is not created.
+        [experiment] = Experiment.objects.bulk_create([Experiment(name=name)])
+        return experiment
+
+    return _make_experiment
+
+
 @pytest.fixture
 def tent(experiment: Experiment) -> Tent:
     return Tent.objects.get(experiment=experiment, code="TN1")
 
 
 @pytest.fixture
-def make_slot(tent: Tent):
+def tent_id(tent: Tent) -> UUID:
+    return tent.id
+
+
+@pytest.fixture
+def make_slot(tent_id: UUID):
     def _make_slot(shelf: int = 1, position: int = 1) -> Slot:
-        return Slot.objects.create(tent=tent, shelf_index=shelf, slot_index=position)
+        return Slot.objects.create(tent_id=tent_id, shelf_index=shelf, slot_index=position)
 
     return _make_slot
 
@@ -57,16 +90,23 @@ def make_plant(experiment: Experiment, species: Species):
         *,
         grade: str | None = None,
         selected_species: Species | None = None,
+        selected_experiment: Experiment | None = None,
         assigned_recipe: Recipe | None = None,
     ) -> Plant:
-        return Plant.objects.create(
-            experiment=experiment,
-            species=selected_species or species,
-            plant_id=plant_id,
-            grade=grade,
-            assigned_recipe=assigned_recipe,
-            status=Plant.Status.ACTIVE,
+        # Plant has no save() override or post_save receivers, so skip signal dispatch.
+        [plant] = Plant.objects.bulk_create(
+            [
+                Plant(
+                    experiment=selected_experiment or experiment,
+                    species=selected_species or species,
+                    plant_id=plant_id,
+                    grade=grade,
+                    assigned_recipe=assigned_recipe,
+                    status=Plant.Status.ACTIVE,
+                )
+            ]
         )
+        return plant
 
     return _make_plant
 
@@ -88,8 +128,12 @@ def mark_baseline(experiment: Experiment):
 def ready_to_start(experiment: Experiment, make_slot, make_plant, mark_baseline):
     def _ready_to_start() -> Plant:
         slot = make_slot(1, 1)
-        Recipe.objects.create(experiment=experiment, code="R0", name="Control")
-        recipe = Recipe.objects.create(experiment=experiment, code="R1", name="Treatment")
+        _, recipe = Recipe.objects.bulk_create(
+            [
+                Recipe(experiment=experiment, code="R0", name="Control"),
+                Recipe(experiment=experiment, code="R1", name="Treatment"),
+            ]
+        )
         plant = make_plant("NP-READY-001", grade="A", assigned_recipe=recipe)
         mark_baseline(plant)
         tray = Tray.objects.create(
@@ -98,7 +142,7 @@ def ready_to_start(experiment: Experiment, make_slot, make_plant, mark_baseline)
             slot=slot,
             capacity=4,
         )
-        tray.plants.add(plant)
+        TrayPlant.objects.create(tray=tray, plant=plant)
         return plant
 
     return _ready_to_start
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from api.baseline_grade import compute_auto_baseline_grade
+
+# Pure grading rules: no django_db mark, so these run without a test transaction.
+
+
+def test_auto_grade_guardrails():
+    assert compute_auto_baseline_grade(
+        {
+            "vigor": 5,
+            "feature_count": 5,
+            "feature_quality": 5,
+            "color_turgor": 5,
+            "damage_pests": 5,
+        }
+    ) == "A"
+    assert compute_auto_baseline_grade(
+        {
+            "vigor": 4,
+            "feature_count": 4,
+            "feature_quality": 4,
+            "color_turgor": 4,
+            "damage_pests": 4,
+        }
+    ) == "A"
+    assert compute_auto_baseline_grade(
+        {
+            "vigor": 3,
+            "feature_count": 3,
+            "feature_quality": 3,
+            "color_turgor": 3,
+            "damage_pests": 3,
+        }
+    ) == "B"
+    assert compute_auto_baseline_grade(
+        {
+            "vigor": 4,
+            "feature_count": 3,
+            "feature_quality": 4,
+            "color_turgor": 3,
+            "damage_pests": 4,
+        }
+    ) == "B"
+    assert compute_auto_baseline_grade(
+        {
+            "vigor": 1,
+            "feature_count": 5,
+            "feature_quality": 5,
+            "color_turgor": 5,
+            "damage_pests": 5,
+        }
+    ) == "C"
+    assert compute_auto_baseline_grade(
+        {
+            "vigor": 2,
+            "feature_count": 1,
+            "feature_quality": 1,
+            "color_turgor": 5,
+            "damage_pests": 5,
+        }
+    ) == "C"
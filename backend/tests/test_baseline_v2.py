@@ -3,12 +3,12 @@ from __future__ import annotations
 from datetime import timedelta
 
 import pytest
-from django.utils import timezone
 
 from api.baseline import BASELINE_WEEK_NUMBER
-from api.baseline_grade import compute_auto_baseline_grade
 from api.models import Photo, PlantWeeklyMetric
 
+from .urls import api_url
+
 pytestmark = pytest.mark.django_db
 
 
@@ -38,7 +38,7 @@ def test_auto_grade_roundtrip_and_grade_source(api_client, experiment, make_plan
     plant = make_plant("NP-500")
 
     save_response = api_client.post(
-        f"/api/v1/plants/{plant.id}/baseline",
+        api_url("plant-baseline", plant_id=plant.id),
         {
             **_baseline_payload(
                 vigor=5,
@@ -60,7 +60,7 @@ def test_auto_grade_roundtrip_and_grade_source(api_client, experiment, make_plan
     assert isinstance(save_payload["metrics"]["baseline_v1"]["captured_at"], str)
     assert isinstance(save_payload["baseline_captured_at"], str)
 
-    get_response = api_client.get(f"/api/v1/plants/{plant.id}/baseline")
+    get_response = api_client.get(api_url("plant-baseline", plant_id=plant.id))
     assert get_response.status_code == 200
     get_payload = get_response.json()
     assert get_payload["grade"] == "A"
@@ -71,19 +71,19 @@ def test_auto_grade_roundtrip_and_grade_source(api_client, experiment, make_plan
     assert get_payload["species_name"] == plant.species.name
     assert get_payload["species_category"] == plant.species.category
 
-    weekly_metric = PlantWeeklyMetric.objects.get(
-        experiment=experiment,
-        plant=plant,
+    stored_metrics = PlantWeeklyMetric.objects.values_list("metrics", flat=True).get(
+        experiment_id=experiment.id,
+        plant_id=plant.id,
         week_number=BASELINE_WEEK_NUMBER,
     )
-    assert weekly_metric.metrics["baseline_v1"]["grade_source"] == "auto"
+    assert stored_metrics["baseline_v1"]["grade_source"] == "auto"
 
 
 def test_manual_grade_override_persists(api_client, make_plant):
     plant = make_plant("NP-501")
 
     response = api_client.post(
-        f"/api/v1/plants/{plant.id}/baseline",
+        api_url("plant-baseline", plant_id=plant.id),
         {
             **_baseline_payload(vigor=5, feature_count=5, feature_quality=5, color_turgor=5, damage_pests=5),
             "grade_source": "manual",
@@ -102,7 +102,7 @@ def test_baseline_post_validation_errors(api_client, make_plant):
     plant = make_plant("NP-502")
 
     missing_namespace = api_client.post(
-        f"/api/v1/plants/{plant.id}/baseline",
+        api_url("plant-baseline", plant_id=plant.id),
         {"metrics": {"vigor": 4}, "grade_source": "auto"},
         format="json",
     )
@@ -110,7 +110,7 @@ def test_baseline_post_validation_errors(api_client, make_plant):
     assert "metrics" in missing_namespace.json()
 
     out_of_range = api_client.post(
-        f"/api/v1/plants/{plant.id}/baseline",
+        api_url("plant-baseline", plant_id=plant.id),
         {
             **_baseline_payload(vigor=6),
             "grade_source": "auto",
@@ -121,7 +121,7 @@ def test_baseline_post_validation_errors(api_client, make_plant):
     assert "metrics" in out_of_range.json()
 
     missing_manual_grade = api_client.post(
-        f"/api/v1/plants/{plant.id}/baseline",
+        api_url("plant-baseline", plant_id=plant.id),
         {
             **_baseline_payload(),
             "grade_source": "manual",
@@ -132,67 +132,10 @@ def test_baseline_post_validation_errors(api_client, make_plant):
     assert "grade" in missing_manual_grade.json()
 
 
-def test_auto_grade_guardrails():
-    assert compute_auto_baseline_grade(
-        {
-            "vigor": 5,
-            "feature_count": 5,
-            "feature_quality": 5,
-            "color_turgor": 5,
-            "damage_pests": 5,
-        }
-    ) == "A"
-    assert compute_auto_baseline_grade(
-        {
-            "vigor": 4,
-            "feature_count": 4,
-            "feature_quality": 4,
-            "color_turgor": 4,
-            "damage_pests": 4,
-        }
-    ) == "A"
-    assert compute_auto_baseline_grade(
-        {
-            "vigor": 3,
-            "feature_count": 3,
-            "feature_quality": 3,
-            "color_turgor": 3,
-            "damage_pests": 3,
-        }
-    ) == "B"
-    assert compute_auto_baseline_grade(
-        {
-            "vigor": 4,
-            "feature_count": 3,
-            "feature_quality": 4,
-            "color_turgor": 3,
-            "damage_pests": 4,
-        }
-    ) == "B"
-    assert compute_auto_baseline_grade(
-        {
-            "vigor": 1,
-            "feature_count": 5,
-            "feature_quality": 5,
-            "color_turgor": 5,
-            "damage_pests": 5,
-        }
-    ) == "C"
-    assert compute_auto_baseline_grade(
-        {
-            "vigor": 2,
-            "feature_count": 1,
-            "feature_quality": 1,
-            "color_turgor": 5,
-            "damage_pests": 5,
-        }
-    ) == "C"
-
-
 def test_baseline_queue_includes_species_fields(api_client, experiment, make_plant):
     plant = make_plant("NP-503")
     save_response = api_client.post(
-        f"/api/v1/plants/{plant.id}/baseline",
+        api_url("plant-baseline", plant_id=plant.id),
         {
             **_baseline_payload(),
             "grade_source": "auto",
@@ -201,7 +144,7 @@ def test_baseline_queue_includes_species_fields(api_client, experiment, make_pla
     )
     assert save_response.status_code == 200
 
-    response = api_client.get(f"/api/v1/experiments/{experiment.id}/baseline/queue")
+    response = api_client.get(api_url("experiment-baseline-queue", experiment_id=experiment.id))
     assert response.status_code == 200
     first_row = response.json()["plants"]["results"][0]
     assert "species_name" in first_row
@@ -209,27 +152,33 @@ def test_baseline_queue_includes_species_fields(api_client, experiment, make_pla
     assert isinstance(first_row["baseline_captured_at"], str)
 
 
-def test_baseline_get_includes_latest_baseline_photo(api_client, experiment, make_plant):
+def test_baseline_get_includes_latest_baseline_photo(
+    api_client,
+    app_user,
+    experiment,
+    make_plant,
+    now_utc,
+    django_assert_num_queries,
+):
     plant = make_plant("NP-504")
 
-    older_photo = Photo.objects.create(
-        experiment=experiment,
-        plant=plant,
-        tag=Photo.Tag.BASELINE,
-        week_number=0,
-        file="photos/2026/02/14/older.jpg",
+    older_photo, newer_photo = Photo.objects.bulk_create(
+        [
+            Photo(
+                experiment=experiment,
+                plant=plant,
+                tag=Photo.Tag.BASELINE,
+                week_number=0,
+                file=f"photos/2026/02/14/{name}.jpg",
+            )
+            for name in ("older", "newer")
+        ]
     )
-    newer_photo = Photo.objects.create(
-        experiment=experiment,
-        plant=plant,
-        tag=Photo.Tag.BASELINE,
-        week_number=0,
-        file="photos/2026/02/14/newer.jpg",
-    )
-    Photo.objects.filter(id=older_photo.id).update(created_at=timezone.now() - timedelta(hours=1))
-    Photo.objects.filter(id=newer_photo.id).update(created_at=timezone.now())
+    # created_at is auto_now_add, so only the older photo needs to be backdated.
+    Photo.objects.filter(id=older_photo.id).update(created_at=now_utc - timedelta(hours=1))
 
-    response = api_client.get(f"/api/v1/plants/{plant.id}/baseline")
+    with django_assert_num_queries(6):
+        response = api_client.get(api_url("plant-baseline", plant_id=plant.id))
     assert response.status_code == 200
     payload = response.json()
     assert payload["baseline_photo"] is not None
@@ -240,27 +189,32 @@ def test_baseline_get_includes_latest_baseline_photo(api_client, experiment, mak
     assert payload["baseline_photo"]["url"].endswith("/media/photos/2026/02/14/newer.jpg")
 
 
-def test_baseline_queue_includes_latest_baseline_photo_per_plant(api_client, experiment, make_plant):
+def test_baseline_queue_includes_latest_baseline_photo_per_plant(
+    api_client,
+    app_user,
+    experiment,
+    make_plant,
+    now_utc,
+    django_assert_num_queries,
+):
     plant = make_plant("NP-505")
 
-    older_photo = Photo.objects.create(
-        experiment=experiment,
-        plant=plant,
-        tag=Photo.Tag.BASELINE,
-        week_number=0,
-        file="photos/2026/02/14/old-queue.jpg",
-    )
-    newer_photo = Photo.objects.create(
-        experiment=experiment,
-        plant=plant,
-        tag=Photo.Tag.BASELINE,
-        week_number=0,
-        file="photos/2026/02/14/new-queue.jpg",
+    older_photo, newer_photo = Photo.objects.bulk_create(
+        [
+            Photo(
+                experiment=experiment,
+                plant=plant,
+                tag=Photo.Tag.BASELINE,
+                week_number=0,
+                file=f"photos/2026/02/14/{name}.jpg",
+            )
+            for name in ("old-queue", "new-queue")
+        ]
     )
-    Photo.objects.filter(id=older_photo.id).update(created_at=timezone.now() - timedelta(minutes=30))
-    Photo.objects.filter(id=newer_photo.id).update(created_at=timezone.now())
+    Photo.objects.filter(id=older_photo.id).update(created_at=now_utc - timedelta(minutes=30))
 
-    response = api_client.get(f"/api/v1/experiments/{experiment.id}/baseline/queue")
+    with django_assert_num_queries(6):
+        response = api_client.get(api_url("experiment-baseline-queue", experiment_id=experiment.id))
     assert response.status_code == 200
     rows = response.json()["plants"]["results"]
     row = next(item for item in rows if item["uuid"] == str(plant.id))
@@ -2,9 +2,19 @@ from __future__ import annotations
 
 import pytest
 
+from .urls import api_url
+
 pytestmark = pytest.mark.django_db
 
 
+# (url name, key holding the envelope or None when the payload is the envelope)
+ENVELOPE_LIST_ENDPOINTS = (
+    ("experiment-plants", None),
+    ("experiment-tents", None),
+    ("experiment-baseline-queue", "plants"),
+)
+
+
 def test_list_endpoints_use_envelope_shape(
     api_client,
     experiment,
@@ -14,27 +24,22 @@ def test_list_endpoints_use_envelope_shape(
 ):
     make_plant("NP-001")
 
-    with django_assert_max_num_queries(20):
-        plants = api_client.get(f"/api/v1/experiments/{experiment.id}/plants/")
-    assert plants.status_code == 200
-    assert_envelope(plants.json())
-
-    tents = api_client.get(f"/api/v1/experiments/{experiment.id}/tents")
-    assert tents.status_code == 200
-    assert_envelope(tents.json())
-
-
-def test_baseline_queue_uses_envelope(api_client, experiment, make_plant, assert_envelope):
-    make_plant("NP-001")
-    response = api_client.get(f"/api/v1/experiments/{experiment.id}/baseline/queue")
-    assert response.status_code == 200
-    payload = response.json()
-    assert "plants" in payload
-    assert_envelope(payload["plants"])
+    for url_name, envelope_key in ENVELOPE_LIST_ENDPOINTS:
+        with django_assert_max_num_queries(20):
+            response = api_client.get(api_url(url_name, experiment_id=experiment.id))
+        assert response.status_code == 200, url_name
+        payload = response.json()
+        assert_envelope(payload[envelope_key] if envelope_key else payload)
 
 
-def test_status_summary_uses_current_schema_shape(api_client, experiment):
-    response = api_client.get(f"/api/v1/experiments/{experiment.id}/status/summary")
+def test_status_summary_uses_current_schema_shape(
+    api_client,
+    app_user,
+    experiment,
+    django_assert_num_queries,
+):
+    with django_assert_num_queries(17):
+        response = api_client.get(api_url("experiment-status-summary", experiment_id=experiment.id))
     assert response.status_code == 200
     payload = response.json()
 
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 
-from api.models import Experiment, Recipe, Tray
+from api.models import Experiment, Recipe, Tray, TrayPlant
+
+from .urls import api_url
 
 pytestmark = pytest.mark.django_db
 
+AUTO_PLACE_CLEAR_BODY = json.dumps({"clear_existing": True}).encode()
+
 
 def test_blocked_start_includes_diagnostics(
     api_client,
     experiment,
     assert_blocked_diagnostics,
 ):
-    response = api_client.post(f"/api/v1/experiments/{experiment.id}/start")
+    response = api_client.post(api_url("experiment-start", experiment_id=experiment.id))
     assert response.status_code == 409
     payload = response.json()
     assert_blocked_diagnostics(payload)
@@ -27,7 +33,7 @@ def test_feed_blocked_when_not_running_includes_diagnostics(
     assert_blocked_diagnostics,
 ):
     plant = make_plant("NP-200", grade="A")
-    response = api_client.post(f"/api/v1/plants/{plant.id}/feed", {"amount_text": "1 mL"}, format="json")
+    response = api_client.post(api_url("plant-feed", plant_id=plant.id), {"amount_text": "1 mL"}, format="json")
     assert response.status_code == 409
     payload = response.json()
     assert_blocked_diagnostics(payload, reason_key="experiment_not_running")
@@ -45,12 +51,12 @@ def test_feed_blocked_when_plant_recipe_missing_includes_diagnostics(
     slot = make_slot(1, 1)
     tray = Tray.objects.create(experiment=experiment, name="TR-201", slot=slot, capacity=2)
     plant = make_plant("NP-201", grade="A")
-    tray.plants.add(plant)
+    TrayPlant.objects.create(tray=tray, plant=plant)
     experiment.lifecycle_state = Experiment.LifecycleState.RUNNING
     experiment.started_at = now_utc
     experiment.save(update_fields=["lifecycle_state", "started_at", "updated_at"])
 
-    response = api_client.post(f"/api/v1/plants/{plant.id}/feed", {"amount_text": "1 mL"}, format="json")
+    response = api_client.post(api_url("plant-feed", plant_id=plant.id), {"amount_text": "1 mL"}, format="json")
     assert response.status_code == 409
     payload = response.json()
     assert_blocked_diagnostics(payload, reason_key="plant_recipe_missing")
@@ -65,9 +71,9 @@ def test_auto_place_blocked_includes_diagnostics(
 ):
     make_plant("NP-300", grade=None)
     response = api_client.post(
-        f"/api/v1/experiments/{experiment.id}/placement/auto",
-        {"clear_existing": True},
-        format="json",
+        api_url("experiment-placement-auto", experiment_id=experiment.id),
+        AUTO_PLACE_CLEAR_BODY,
+        content_type="application/json",
     )
     assert response.status_code == 409
     payload = response.json()
@@ -76,27 +82,34 @@ def test_auto_place_blocked_includes_diagnostics(
 
 def test_start_blocked_when_plant_recipe_missing(
     api_client,
+    app_user,
     experiment,
     make_slot,
     make_plant,
     mark_baseline,
     assert_blocked_diagnostics,
+    django_assert_num_queries,
 ):
     slot = make_slot(1, 1)
-    Recipe.objects.create(experiment=experiment, code="R0", name="Control")
-    Recipe.objects.create(experiment=experiment, code="R1", name="Treatment")
+    Recipe.objects.bulk_create(
+        [
+            Recipe(experiment=experiment, code="R0", name="Control"),
+            Recipe(experiment=experiment, code="R1", name="Treatment"),
+        ]
+    )
     plant = make_plant("NP-READY-002", grade="A")
     mark_baseline(plant)
     tray = Tray.objects.create(experiment=experiment, name="TR-READY-2", slot=slot, capacity=2)
-    tray.plants.add(plant)
+    TrayPlant.objects.create(tray=tray, plant=plant)
 
-    summary = api_client.get(f"/api/v1/experiments/{experiment.id}/status/summary")
+    with django_assert_num_queries(18):
+        summary = api_client.get(api_url("experiment-status-summary", experiment_id=experiment.id))
     assert summary.status_code == 200
     summary_payload = summary.json()
     assert summary_payload["readiness"]["counts"]["needs_plant_recipe"] == 1
     assert summary_payload["readiness"]["ready_to_start"] is False
 
-    response = api_client.post(f"/api/v1/experiments/{experiment.id}/start")
+    response = api_client.post(api_url("experiment-start", experiment_id=experiment.id))
     assert response.status_code == 409
     payload = response.json()
     assert_blocked_diagnostics(payload, reason_key="needs_plant_recipe")
@@ -108,20 +121,25 @@ def test_feed_event_stores_recipe_snapshot_when_plant_recipe_changes(
     make_slot,
     make_plant,
     now_utc,
+    django_assert_num_queries,
 ):
     slot = make_slot(1, 1)
-    recipe_initial = Recipe.objects.create(experiment=experiment, code="R0", name="Control")
-    recipe_next = Recipe.objects.create(experiment=experiment, code="R1", name="Treatment")
+    recipe_initial, recipe_next = Recipe.objects.bulk_create(
+        [
+            Recipe(experiment=experiment, code="R0", name="Control"),
+            Recipe(experiment=experiment, code="R1", name="Treatment"),
+        ]
+    )
     plant = make_plant("NP-READY-003", grade="A", assigned_recipe=recipe_initial)
     tray = Tray.objects.create(experiment=experiment, name="TR-READY-3", slot=slot, capacity=2)
-    tray.plants.add(plant)
+    TrayPlant.objects.create(tray=tray, plant=plant)
 
     experiment.lifecycle_state = Experiment.LifecycleState.RUNNING
     experiment.started_at = now_utc
     experiment.save(update_fields=["lifecycle_state", "started_at", "updated_at"])
 
     feed_response = api_client.post(
-        f"/api/v1/plants/{plant.id}/feed",
+        api_url("plant-feed", plant_id=plant.id),
         {"amount_text": "2 mL"},
         format="json",
     )
@@ -132,7 +150,8 @@ def test_feed_event_stores_recipe_snapshot_when_plant_recipe_changes(
     plant.assigned_recipe = recipe_next
     plant.save(update_fields=["assigned_recipe", "updated_at"])
 
-    recent_response = api_client.get(f"/api/v1/plants/{plant.id}/feeding/recent")
+    with django_assert_num_queries(4):
+        recent_response = api_client.get(api_url("plant-feeding-recent", plant_id=plant.id))
     assert recent_response.status_code == 200
     recent_payload = recent_response.json()
     assert recent_payload["events"]["count"] == 1
@@ -142,19 +161,20 @@ def test_feed_event_stores_recipe_snapshot_when_plant_recipe_changes(
 def test_lifecycle_start_stop_roundtrip_for_ready_experiment(api_client, experiment, ready_to_start):
     ready_to_start()
 
-    before = api_client.get(f"/api/v1/experiments/{experiment.id}/status/summary")
+    before = api_client.get(api_url("experiment-status-summary", experiment_id=experiment.id))
     assert before.status_code == 200
-    assert before.json()["readiness"]["ready_to_start"] is True
-    assert before.json()["lifecycle"]["state"] == Experiment.LifecycleState.DRAFT
+    before_payload = before.json()
+    assert before_payload["readiness"]["ready_to_start"] is True
+    assert before_payload["lifecycle"]["state"] == Experiment.LifecycleState.DRAFT
 
-    started = api_client.post(f"/api/v1/experiments/{experiment.id}/start")
+    started = api_client.post(api_url("experiment-start", experiment_id=experiment.id))
     assert started.status_code == 200
     started_payload = started.json()
     assert started_payload["lifecycle"]["state"] == Experiment.LifecycleState.RUNNING
     assert started_payload["lifecycle"]["started_at"] is not None
     assert started_payload["lifecycle"]["stopped_at"] is None
 
-    stopped = api_client.post(f"/api/v1/experiments/{experiment.id}/stop")
+    stopped = api_client.post(api_url("experiment-stop", experiment_id=experiment.id))
     assert stopped.status_code == 200
     stopped_payload = stopped.json()
     assert stopped_payload["lifecycle"]["state"] == Experiment.LifecycleState.STOPPED
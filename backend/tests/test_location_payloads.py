@@ -2,16 +2,26 @@ from __future__ import annotations
 
 import pytest
 
-from api.models import Recipe, Tray
+from api.models import Recipe, Tray, TrayPlant
+from api.tray_placement import (
+    experiment_placement_infos,
+    experiment_tray_placements,
+    placement_info,
+    plant_tray_placement,
+)
+
+from .urls import api_url
 
 pytestmark = pytest.mark.django_db
 
 
 def test_overview_cockpit_feeding_use_nested_location(
     api_client,
+    app_user,
     experiment,
     make_slot,
     make_plant,
+    django_assert_num_queries,
 ):
     slot = make_slot(1, 1)
     recipe = Recipe.objects.create(experiment=experiment, code="R0", name="Control")
@@ -22,9 +32,10 @@ def test_overview_cockpit_feeding_use_nested_location(
         capacity=4,
     )
     plant = make_plant("NP-100", grade="A", assigned_recipe=recipe)
-    tray.plants.add(plant)
+    TrayPlant.objects.create(tray=tray, plant=plant)
 
-    overview = api_client.get(f"/api/v1/experiments/{experiment.id}/overview/plants")
+    with django_assert_num_queries(7):
+        overview = api_client.get(api_url("experiment-overview-plants", experiment_id=experiment.id))
     assert overview.status_code == 200
     overview_item = overview.json()["plants"]["results"][0]
     assert "location" in overview_item
@@ -32,28 +43,55 @@ def test_overview_cockpit_feeding_use_nested_location(
     assert overview_item["assigned_recipe"]["code"] == "R0"
     assert "tent_id" not in overview_item
 
-    cockpit = api_client.get(f"/api/v1/plants/{plant.id}/cockpit")
+    with django_assert_num_queries(20):
+        cockpit = api_client.get(api_url("plant-cockpit", plant_id=plant.id))
     assert cockpit.status_code == 200
     cockpit_payload = cockpit.json()
     cockpit_location = cockpit_payload["derived"]["location"]
     assert cockpit_location["status"] == "placed"
     assert cockpit_payload["derived"]["assigned_recipe"]["code"] == "R0"
 
-    feeding = api_client.get(f"/api/v1/experiments/{experiment.id}/feeding/queue")
+    with django_assert_num_queries(7):
+        feeding = api_client.get(api_url("experiment-feeding-queue", experiment_id=experiment.id))
     assert feeding.status_code == 200
     feed_item = feeding.json()["plants"]["results"][0]
     assert "location" in feed_item
     assert feed_item["assigned_recipe"]["code"] == "R0"
 
-    placement = api_client.get(f"/api/v1/experiments/{experiment.id}/placement/summary")
+    with django_assert_num_queries(11):
+        placement = api_client.get(api_url("experiment-placement-summary", experiment_id=experiment.id))
     assert placement.status_code == 200
     placement_tray = placement.json()["trays"]["results"][0]
     assert "location" in placement_tray
     assert "assigned_recipe" not in placement_tray
     assert placement_tray["plants"][0]["assigned_recipe"]["code"] == "R0"
 
-    rotation = api_client.get(f"/api/v1/experiments/{experiment.id}/rotation/summary")
+    with django_assert_num_queries(6):
+        rotation = api_client.get(api_url("experiment-rotation-summary", experiment_id=experiment.id))
     assert rotation.status_code == 200
     rotation_tray = rotation.json()["trays"]["results"][0]
     assert "location" in rotation_tray
     assert "assigned_recipe" not in rotation_tray
+
+
+def test_placement_infos_match_orm_placement_info(experiment, make_slot, make_plant):
+    slotted_tray, unslotted_tray = Tray.objects.bulk_create(
+        [
+            Tray(experiment=experiment, name="TR-SLOTTED", slot=make_slot(1, 1), capacity=4),
+            Tray(experiment=experiment, name="TR-UNSLOTTED", capacity=4),
+        ]
+    )
+    slotted_plant = make_plant("NP-110")
+    unslotted_plant = make_plant("NP-111")
+    TrayPlant.objects.bulk_create(
+        [
+            TrayPlant(tray=slotted_tray, plant=slotted_plant, order_index=1),
+            TrayPlant(tray=unslotted_tray, plant=unslotted_plant, order_index=1),
+        ]
+    )
+
+    infos = experiment_placement_infos(experiment.id)
+    placements = experiment_tray_placements(experiment.id)
+    for plant in (slotted_plant, unslotted_plant):
+        assert infos[str(plant.id)] == placement_info(plant_tray_placement(plant))
+        assert infos[str(plant.id)] == placement_info(placements[str(plant.id)])
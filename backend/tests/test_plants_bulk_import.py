@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+from api.models import Plant, Species
+
+from .urls import api_url
+
+pytestmark = pytest.mark.django_db
+
+REPEATED_SPECIES_CSV = (
+    "species_name,category,quantity\n"
+    "Sarracenia flava,,2\n"
+    "sarracenia flava,sarracenia,1\n"
+    "Sarracenia Flava,,1\n"
+)
+
+
+def test_bulk_import_reuses_species_across_rows_and_backfills_category(api_client, experiment):
+    response = api_client.post(
+        api_url("experiment-plants-bulk-import", experiment_id=experiment.id),
+        {"csv_text": REPEATED_SPECIES_CSV},
+        format="json",
+    )
+    assert response.status_code == 201
+    payload = response.json()
+    assert payload["created_count"] == 4
+    assert [item["name"] for item in payload["species"]] == ["Sarracenia flava"]
+
+    species = Species.objects.get(name__iexact="sarracenia flava")
+    assert species.category == "sarracenia"
+    assert set(
+        Plant.objects.filter(experiment=experiment).values_list("species_id", flat=True)
+    ) == {species.id}
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.models import FeedingEvent, Plant, Recipe, Tray, TrayPlant
+
+from .urls import api_url
+
+pytestmark = pytest.mark.django_db
+
+EXPERIMENT_AGGREGATE_ENDPOINTS = (
+    "experiment-overview-plants",
+    "experiment-status-summary",
+    "experiment-feeding-queue",
+    "experiment-placement-summary",
+    "experiment-rotation-summary",
+)
+
+
+def _captured_queries(api_client, url: str) -> list[str]:
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(url)
+    assert response.status_code == 200, url
+    return [query["sql"] for query in context.captured_queries]
+
+
+@pytest.mark.parametrize("url_name", EXPERIMENT_AGGREGATE_ENDPOINTS)
+def test_experiment_aggregate_query_count_does_not_scale_with_plants(
+    api_client,
+    app_user,
+    experiment,
+    species,
+    tent,
+    make_slot,
+    url_name,
+):
+    # A restricted tent exercises the per-plant species check in readiness counts.
+    tent.allowed_species.add(species)
+    recipe = Recipe.objects.create(experiment=experiment, code="R0", name="Control")
+    tray = Tray.objects.create(experiment=experiment, name="TR-BUDGET", slot=make_slot(1, 1), capacity=8)
+    url = api_url(url_name, experiment_id=experiment.id)
+
+    def place_plants(*plant_ids: str) -> None:
+        plants = Plant.objects.bulk_create(
+            [
+                Plant(experiment=experiment, species=species, plant_id=plant_id, assigned_recipe=recipe)
+                for plant_id in plant_ids
+            ]
+        )
+        start_index = TrayPlant.objects.filter(tray=tray).count() + 1
+        TrayPlant.objects.bulk_create(
+            [
+                TrayPlant(tray=tray, plant=plant, order_index=order_index)
+                for order_index, plant in enumerate(plants, start=start_index)
+            ]
+        )
+        FeedingEvent.objects.bulk_create(
+            [FeedingEvent(experiment=experiment, plant=plant, recipe=recipe) for plant in plants]
+        )
+
+    place_plants("NP-800")
+    single_plant_queries = _captured_queries(api_client, url)
+
+    place_plants("NP-801", "NP-802", "NP-803")
+    many_plant_queries = _captured_queries(api_client, url)
+
+    assert len(many_plant_queries) == len(single_plant_queries), "\n".join(many_plant_queries)
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import pytest
 
-from api.models import Experiment, ScheduleAction, ScheduleRule, ScheduleScope, Tray
+from api.models import Experiment, ScheduleAction, ScheduleRule, ScheduleScope, Tray, TrayPlant
+
+from .urls import api_url
 
 pytestmark = pytest.mark.django_db
 
@@ -10,7 +12,7 @@ pytestmark = pytest.mark.django_db
 def test_schedule_plan_is_grouped_and_enveloped(
     api_client,
     experiment,
-    tent,
+    tent_id,
     make_slot,
     make_plant,
     assert_envelope,
@@ -18,33 +20,46 @@ def test_schedule_plan_is_grouped_and_enveloped(
     slot = make_slot(1, 1)
     tray = Tray.objects.create(experiment=experiment, name="TR1", slot=slot, capacity=4)
     plant = make_plant("NP-500", grade="A")
-    tray.plants.add(plant)
+    TrayPlant.objects.create(tray=tray, plant=plant)
 
-    first = ScheduleAction.objects.create(
-        experiment=experiment,
-        title="Feed tent",
-        action_type=ScheduleAction.ActionType.FEED,
-        enabled=True,
+    actions = ScheduleAction.objects.bulk_create(
+        [
+            ScheduleAction(
+                experiment=experiment,
+                title="Feed tent",
+                action_type=ScheduleAction.ActionType.FEED,
+                enabled=True,
+            ),
+            ScheduleAction(
+                experiment=experiment,
+                title="Photo tent",
+                action_type=ScheduleAction.ActionType.PHOTO,
+                enabled=True,
+            ),
+        ]
     )
-    second = ScheduleAction.objects.create(
-        experiment=experiment,
-        title="Photo tent",
-        action_type=ScheduleAction.ActionType.PHOTO,
-        enabled=True,
+    ScheduleRule.objects.bulk_create(
+        [
+            ScheduleRule(
+                schedule_action=action,
+                rule_type=ScheduleRule.RuleType.DAILY,
+                timeframe=ScheduleRule.Timeframe.MORNING,
+            )
+            for action in actions
+        ]
+    )
+    ScheduleScope.objects.bulk_create(
+        [
+            ScheduleScope(
+                schedule_action=action,
+                scope_type=ScheduleScope.ScopeType.TENT,
+                scope_id=tent_id,
+            )
+            for action in actions
+        ]
     )
-    for action in [first, second]:
-        ScheduleRule.objects.create(
-            schedule_action=action,
-            rule_type=ScheduleRule.RuleType.DAILY,
-            timeframe=ScheduleRule.Timeframe.MORNING,
-        )
-        ScheduleScope.objects.create(
-            schedule_action=action,
-            scope_type=ScheduleScope.ScopeType.TENT,
-            scope_id=tent.id,
-        )
 
-    response = api_client.get(f"/api/v1/experiments/{experiment.id}/schedules/plan?days=7")
+    response = api_client.get(api_url("experiment-schedules-plan", experiment_id=experiment.id), {"days": 7})
     assert response.status_code == 200
     payload = response.json()
     assert_envelope(payload["slots"])
@@ -58,7 +73,7 @@ def test_schedule_plan_is_grouped_and_enveloped(
 def test_schedule_feed_blocker_uses_plant_recipe_reason(
     api_client,
     experiment,
-    tent,
+    tent_id,
     make_slot,
     make_plant,
     now_utc,
@@ -66,7 +81,7 @@ def test_schedule_feed_blocker_uses_plant_recipe_reason(
     slot = make_slot(1, 1)
     tray = Tray.objects.create(experiment=experiment, name="TR2", slot=slot, capacity=4)
     plant = make_plant("NP-501", grade="A")
-    tray.plants.add(plant)
+    TrayPlant.objects.create(tray=tray, plant=plant)
     experiment.lifecycle_state = Experiment.LifecycleState.RUNNING
     experiment.started_at = now_utc
     experiment.save(update_fields=["lifecycle_state", "started_at", "updated_at"])
@@ -85,10 +100,10 @@ def test_schedule_feed_blocker_uses_plant_recipe_reason(
     ScheduleScope.objects.create(
         schedule_action=action,
         scope_type=ScheduleScope.ScopeType.TENT,
-        scope_id=tent.id,
+        scope_id=tent_id,
     )
 
-    response = api_client.get(f"/api/v1/experiments/{experiment.id}/schedules/plan?days=1")
+    response = api_client.get(api_url("experiment-schedules-plan", experiment_id=experiment.id), {"days": 1})
     assert response.status_code == 200
     payload = response.json()
     first_slot = payload["slots"]["results"][0]
@@ -1,45 +1,50 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from api.models import Experiment, Tray
 
+from .urls import api_url
+
 pytestmark = pytest.mark.django_db
 
 
-def test_slots_generate_supports_safe_reshape(api_client, experiment, tent, make_slot):
+def _layout_body(*tray_counts: int) -> bytes:
+    shelves = [
+        {"index": index, "tray_count": tray_count}
+        for index, tray_count in enumerate(tray_counts, start=1)
+    ]
+    return json.dumps({"layout": {"schema_version": 1, "shelves": shelves}}).encode()
+
+
+SAFE_RESHAPE_BODY = _layout_body(2)
+ORPHANING_RESHAPE_BODY = _layout_body(0)
+SINGLE_SLOT_BODY = _layout_body(1)
+
+
+def test_slots_generate_supports_safe_reshape(api_client, experiment, tent_id, make_slot):
     slot = make_slot(1, 1)
     tray = Tray.objects.create(experiment=experiment, name="TR1", slot=slot, capacity=2)
 
     safe_response = api_client.post(
-        f"/api/v1/tents/{tent.id}/slots/generate",
-        {
-            "layout": {
-                "schema_version": 1,
-                "shelves": [
-                    {"index": 1, "tray_count": 2},
-                ],
-            }
-        },
-        format="json",
+        api_url("tent-slots-generate", tent_id=tent_id),
+        SAFE_RESHAPE_BODY,
+        content_type="application/json",
     )
     assert safe_response.status_code == 200
-    tray.refresh_from_db()
-    assert tray.slot is not None
-    assert tray.slot.shelf_index == 1
-    assert tray.slot.slot_index == 1
+    tray_slot = Tray.objects.values("slot_id", "slot__shelf_index", "slot__slot_index").get(
+        pk=tray.pk
+    )
+    assert tray_slot["slot_id"] is not None
+    assert tray_slot["slot__shelf_index"] == 1
+    assert tray_slot["slot__slot_index"] == 1
 
     unsafe_response = api_client.post(
-        f"/api/v1/tents/{tent.id}/slots/generate",
-        {
-            "layout": {
-                "schema_version": 1,
-                "shelves": [
-                    {"index": 1, "tray_count": 0},
-                ],
-            }
-        },
-        format="json",
+        api_url("tent-slots-generate", tent_id=tent_id),
+        ORPHANING_RESHAPE_BODY,
+        content_type="application/json",
     )
     assert unsafe_response.status_code == 409
     diagnostics = unsafe_response.json().get("diagnostics", {})
@@ -50,17 +55,19 @@ def test_slots_generate_supports_safe_reshape(api_client, experiment, tent, make
 def test_slots_generate_blocks_while_running_with_diagnostics(
     api_client,
     experiment,
-    tent,
+    tent_id,
     now_utc,
 ):
-    experiment.lifecycle_state = Experiment.LifecycleState.RUNNING
-    experiment.started_at = now_utc
-    experiment.save(update_fields=["lifecycle_state", "started_at", "updated_at"])
+    Experiment.objects.filter(pk=experiment.pk).update(
+        lifecycle_state=Experiment.LifecycleState.RUNNING,
+        started_at=now_utc,
+        updated_at=now_utc,
+    )
 
     response = api_client.post(
-        f"/api/v1/tents/{tent.id}/slots/generate",
-        {"layout": {"schema_version": 1, "shelves": [{"index": 1, "tray_count": 1}]}},
-        format="json",
+        api_url("tent-slots-generate", tent_id=tent_id),
+        SINGLE_SLOT_BODY,
+        content_type="application/json",
     )
     assert response.status_code == 409
     payload = response.json()
@@ -71,7 +78,7 @@ def test_slots_generate_blocks_while_running_with_diagnostics(
 def test_slot_coordinates_are_immutable(api_client, make_slot):
     slot = make_slot(1, 1)
     response = api_client.patch(
-        f"/api/v1/slots/{slot.id}",
+        api_url("slot-detail", slot_id=slot.id),
         {"shelf_index": 2},
         format="json",
     )
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from django.urls import reverse
+
+
+def api_url(url_name: str, **kwargs) -> str:
+    return reverse(url_name, kwargs=kwargs)